@@ -0,0 +1,73 @@
+# filebunny burrow helpers for PowerShell, passed inline as the script text of
+# `powershell -NoExit -Command <contents>` so they run in the global scope.
+# The launcher (filebunny.cli) sets FILEBUNNY_ORIGIN, FILEBUNNY_BURROW=1 and,
+# for verbose sessions, FILEBUNNY_LOG_LEVEL=INFO, and prints the banner first.
+# Helpers forward all remaining arguments to the real `filebunny` subcommands
+# so argparse `-h/--help` works; `hop` only changes directory when a valid
+# path is returned.
+function global:spot {
+    param([Parameter(ValueFromRemainingArguments=$true)][string[]]$Args)
+    if ($Args -and $Args.Count -gt 0) {
+        filebunny spot @Args
+        return
+    }
+    $dest = (filebunny spot)
+    if ($LASTEXITCODE -eq 0 -and $dest) { Write-Output $dest }
+}
+function global:hop {
+    param([Parameter(ValueFromRemainingArguments=$true)][string[]]$Args)
+    # If asking for help, just forward and return (avoid Set-Location)
+    if ($Args -and ($Args -contains '-h' -or $Args -contains '--help')) {
+        filebunny hop @Args
+        return
+    }
+    $dest = (filebunny hop @Args)
+    if ($LASTEXITCODE -ne 0) { return }
+    # Normalize and validate the returned path before attempting to cd
+    if ($null -ne $dest) { $dest = $dest | Select-Object -First 1 }
+    if ($dest) { $dest = $dest.Trim() }
+    if ($dest -and (Test-Path -LiteralPath $dest)) { Set-Location -LiteralPath $dest }
+}
+function global:peek {
+    param([Parameter(ValueFromRemainingArguments=$true)][string[]]$Args)
+    filebunny peek @Args
+}
+function global:dig {
+    param([Parameter(ValueFromRemainingArguments=$true)][string[]]$Args)
+    filebunny dig @Args
+}
+function global:carrot {
+    param([Parameter(ValueFromRemainingArguments=$true)][string[]]$Args)
+    filebunny carrot @Args
+}
+function global:copy {
+    param([Parameter(ValueFromRemainingArguments=$true)][string[]]$Args)
+    filebunny copy @Args
+}
+function global:move {
+    param([Parameter(ValueFromRemainingArguments=$true)][string[]]$Args)
+    filebunny move @Args
+}
+function global:bury {
+    param([Parameter(ValueFromRemainingArguments=$true)][string[]]$Args)
+    filebunny bury @Args
+}
+function global:rename {
+    param([Parameter(ValueFromRemainingArguments=$true)][string[]]$Args)
+    filebunny rename @Args
+}
+# Simple white prompt for this burrow session
+function global:prompt {
+    Write-Host "₍ᐢ. .ᐢ₎ $(Get-Location) > " -NoNewline
+    return ' '
+}
+# leave [-d]: exit the burrow; with -d, revert persisted spot to origin first
+function global:leave {
+    param([switch]$d)
+    if ($d) { $null = filebunny hop $env:FILEBUNNY_ORIGIN }
+    exit
+}
+Remove-Item alias:copy -ErrorAction SilentlyContinue
+Remove-Item alias:move -ErrorAction SilentlyContinue
+Remove-Item alias:rename -ErrorAction SilentlyContinue
+Set-Location -LiteralPath $env:FILEBUNNY_ORIGIN
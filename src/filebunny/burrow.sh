@@ -0,0 +1,90 @@
+# filebunny burrow rc for bash, loaded via `bash --rcfile burrow.sh -i`.
+# The launcher (filebunny.cli) exports FILEBUNNY_ORIGIN, FILEBUNNY_BURROW=1,
+# FILEBUNNY_SOCKET and, for verbose sessions, FILEBUNNY_LOG_LEVEL=INFO, and
+# prints the banner before starting the shell.
+
+# JSON-quote $1 into REPLY (no subshell per argument)
+_fb_json() {
+  local s="$1"
+  s=${s//\\/\\\\}
+  s=${s//\"/\\\"}
+  s=${s//$'\t'/\\t}
+  s=${s//$'\n'/\\n}
+  REPLY="\"$s\""
+}
+# Run a filebunny command via the burrow daemon (see filebunny/daemon.py);
+# fall back to spawning `filebunny` when the daemon or nc is unavailable.
+# The daemon sends `a` before running a request: once that arrives the
+# command may already have run, so it is never retried.
+_fb() {
+  if [ -S "$FILEBUNNY_SOCKET" ] && command -v nc >/dev/null 2>&1; then
+    local req a line sep="" acked="" code=""
+    _fb_json "$PWD"
+    req="{\"cwd\": $REPLY, \"argv\": ["
+    for a in "$@"; do _fb_json "$a"; req+="$sep$REPLY"; sep=", "; done
+    req+="]}"
+    while IFS= read -r line; do
+      case "$line" in
+        a) acked=1 ;;
+        "o "*) printf '%s\n' "${line#o }" ;;
+        "e "*) printf '%s\n' "${line#e }" >&2 ;;
+        "x "*) code="${line#x }" ;;
+      esac
+    done < <(printf '%s\n' "$req" | nc -U "$FILEBUNNY_SOCKET" 2>/dev/null)
+    if [ -n "$acked" ] || [ -n "$code" ]; then
+      if [ -z "$code" ]; then echo "filebunny: burrow daemon gave no result for: $*" >&2; fi
+      return "${code:-1}"
+    fi
+  fi
+  command filebunny "$@"
+}
+spot() {
+  _fb spot
+}
+hop() {
+  local dest
+  if [ $# -gt 0 ]; then
+    dest="$(_fb hop "$1")"
+  else
+    dest="$(_fb hop)"
+  fi
+  if [ -n "$dest" ] && [ -d "$dest" ]; then
+    cd "$dest"
+  fi
+}
+peek() {
+  _fb peek "$@"
+}
+dig() {
+  if [ $# -lt 1 ]; then echo "usage: dig DIR" >&2; return 1; fi
+  _fb dig "$1"
+}
+carrot() {
+  if [ $# -lt 1 ]; then echo "usage: carrot FILE" >&2; return 1; fi
+  _fb carrot "$1"
+}
+copy() {
+  if [ $# -lt 2 ]; then echo "usage: copy SRC DST" >&2; return 1; fi
+  _fb copy "$1" "$2"
+}
+move() {
+  if [ $# -lt 2 ]; then echo "usage: move SRC DST" >&2; return 1; fi
+  _fb move "$1" "$2"
+}
+bury() {
+  if [ $# -lt 1 ]; then echo "usage: bury PATH" >&2; return 1; fi
+  _fb bury "$1"
+}
+rename() {
+  if [ $# -lt 2 ]; then echo "usage: rename SRC DST" >&2; return 1; fi
+  _fb rename "$1" "$2"
+}
+# leave [-d|--discard]: exit subshell; if discard is set, revert persisted spot to origin
+leave() {
+  if [ "$1" = "-d" ]; then
+    _fb hop "$FILEBUNNY_ORIGIN" >/dev/null
+  fi
+  builtin exit
+}
+# Simple white prompt for this burrow session
+PS1='₍ᐢ. .ᐢ₎ \w > '
@@ -12,25 +12,34 @@ Design principles:
 - Nested subshells are disallowed to avoid confusing prompts and state.
 """
 
-import argparse
-from importlib.metadata import version as pkg_version
+from functools import cache, lru_cache
 from filebunny import __version__ as FB_VERSION
 import logging
 import sys
 import os
-import subprocess
-import platform
-import tempfile
-import textwrap
 from pathlib import Path
-from datetime import datetime
-from filebunny.manager import FileManager
-from filebunny.storage import Storage
+from types import SimpleNamespace
+
+# Heavier modules (argparse, subprocess, platform, tempfile, datetime, and the
+# FileManager/Storage stack with shutil/platformdirs) are imported inside
+# the branches that need them, so quick commands like `spot`/`hop` start fast.
+
+# peek timestamps look like `9/28/2025  10:11 AM` (no leading zeros in m/d/h,
+# two spaces before the time). The no-padding flag is `#` on Windows, `-` elsewhere.
+_PEEK_TIME_FMT = "%#m/%#d/%Y  %#I:%M %p" if os.name == "nt" else "%-m/%-d/%Y  %-I:%M %p"
+# peek Mode column values
+_MODE_DIR = 'd-----'
+_MODE_FILE = '-a----'
+# peek column header and separator rows (fixed, so built once)
+_PEEK_HEADER = (
+    f"{'Mode':<6}  {'LastWriteTime':<22}  {'Length':>10} {'Name'}\n"
+    f"{'-'*4:<6}  {'-'*13:<22}  {'-'*6:>10} {'-'*4}"
+)
 
 # Shared banner (ASCII bunny + quick guide).
 # Shown for top-level `filebunny -h` and at subshell startup. The version line
-# is injected dynamically above the "Core Commands" heading.
-HEADER_BUNNY = textwrap.dedent("""
+# is injected above the "Core Commands" heading once, see `BANNER` below.
+HEADER_BUNNY = """
 ⠀⠀⠀⠀⠀⠀⠀⠀⣠⣤⣦⣤⣄⡀⠀⠀⠀⠀⢀⣀⣀⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
 ⠀⠀⠀⠀⠀⠀⣰⠟⠙⠀⠀⠀⠈⢻⡆⠀⣴⠞⠋⠉⠉⠙⠳⣦⡀⠀⠀⠀⠀⠀⠀⠀
 ⠀⠀⠀⠀⠀⢸⡛⠂⠀⠀⠀⠀⠀⠈⣿⣾⠋⠀⠀⠀⠀⠀⠀⠈⣿⡄⠀⠀⠀⠀⠀⠀
@@ -73,20 +82,250 @@ Tips
 - Help: filebunny -h  |  filebunny <command> -h
 - Version: filebunny -v  |  filebunny --version
 - Verbose decorators: filebunny -V  (enabled for this run or the whole burrow)
-""")
+"""
 
-def main():
-    """Main CLI entry point.
 
-    Responsibilities:
-    - Build the argparse tree and register global flags (e.g., `-v/--version`).
-    - Print the ASCII banner for top-level help without a subcommand.
-    - Launch an interactive subshell (PowerShell/bash) when no subcommand is
-      provided, with helpers bound for convenience.
-    - Disallow nested subshells via `FILEBUNNY_BURROW`.
-    - For direct subcommands, operate relative to the caller's current working
-      directory (CWD), not the persisted spot.
+@cache
+def _get_version() -> str:
+    """Prefer runtime package __version__, fall back to installed metadata."""
+    if FB_VERSION:
+        return FB_VERSION
+    try:
+        from importlib.metadata import version as pkg_version
+        return pkg_version("filebunny")
+    except Exception:
+        return "unknown"
+
+
+# Banner with the version injected above 'Core Commands', built once at import.
+BANNER = HEADER_BUNNY.replace("Core Commands", f"filebunny {_get_version()}\n\nCore Commands")
+
+def _apply_env_log_level() -> None:
+    """Honor FILEBUNNY_LOG_LEVEL for this process (helps tests and direct runs)."""
+    _lvl = os.environ.get("FILEBUNNY_LOG_LEVEL")
+    if _lvl:
+        try:
+            logging.getLogger().setLevel(getattr(logging, _lvl.upper(), logging.INFO))
+        except Exception:
+            logging.getLogger().setLevel(logging.INFO)
+
+
+@cache
+def _get_storage():
+    """One Storage per process, so long-lived callers (the burrow daemon)
+    reuse a single background writer instead of starting one per command."""
+    from filebunny.storage import Storage
+
+    return Storage()
+
+
+def _direct_manager(cwd: str | None = None):
+    """Build a FileManager for direct subcommands.
+
+    Direct subcommands (not auto-burrow) operate relative to the caller's
+    current working directory (CWD), not the persisted spot. An explicit
+    `cwd` (the burrow daemon's caller) or FILEBUNNY_CWD, when set, stands in
+    for the process CWD.
+    """
+    from filebunny.manager import FileManager
+
+    fm = FileManager(_get_storage())
+    fm.cwd = Path(cwd or os.environ.get("FILEBUNNY_CWD") or os.getcwd())
+    return fm
+
+
+# Subcommand handlers. Each takes the FileManager and the parsed args (any
+# object exposing the subcommand's attributes) and imports what it needs.
+
+def _handle_spot(fm, args) -> None:
+    try:
+        print(fm.spot())
+    except Exception as e:
+        sys.stderr.write(f"spot error: {e}\n")
+        raise SystemExit(1)
+
+
+def _handle_hop(fm, args) -> None:
+    try:
+        print(fm.hop(args.path))
+    except Exception as e:
+        sys.stderr.write(f"hop error: {e}\n")
+        raise SystemExit(1)
+
+
+def _handle_peek(fm, args) -> None:
+    # Build a long listing from the current spot
+    # os.scandir yields DirEntry objects whose is_dir()/stat() reuse the
+    # type/stat info from the directory read instead of re-stat'ing.
+    root = Path(fm.spot())
+    show_all = getattr(args, "all", False)
+    # Decorate-sort-undecorate: is_dir()/lower() run once per entry; the exact
+    # name breaks case-insensitive ties so DirEntry objects are never compared.
+    with os.scandir(root) as it:
+        decorated = [
+            (not e.is_dir(), e.name.lower(), e.name, e)
+            for e in it
+            if show_all or e.name[0] != '.'
+        ]
+    decorated.sort()
+
+    # Header; rows are collected and written to stdout in one call
+    lines = [f"\n\nDig: {root}\n", _PEEK_HEADER]
+
+    from datetime import datetime
+    fromtimestamp = datetime.fromtimestamp
+
+    # The is_dir flag from the sort key drives mode and length; one stat per row
+    for is_file, _, name, entry in decorated:
+        try:
+            st = entry.stat()
+            when = fromtimestamp(st.st_mtime).strftime(_PEEK_TIME_FMT)
+            if is_file:
+                lines.append(f"{_MODE_FILE:<6}  {when:<22}  {st.st_size:>10} {name}")
+            else:
+                lines.append(f"{_MODE_DIR:<6}  {when:<22}  {'':>10} {name}")
+        except OSError as e:
+            # On error stat'ing an entry, show minimal info
+            sys.stderr.write(f"peek error: {name}: {e}\n")
+    sys.stdout.write("\n".join(lines) + "\n\n\n")
+
+
+def _handle_copy(fm, args) -> None:
+    fm.copy(args.src, args.dst)
+    print(f"Copied {args.src} to {args.dst}")
+
+
+def _handle_move(fm, args) -> None:
+    fm.move(args.src, args.dst)
+    print(f"Moved {args.src} to {args.dst}")
+
+
+def _handle_bury(fm, args) -> None:
+    fm.delete(args.path)
+    print(f"Buried {args.path}")
+
+
+def _handle_rename(fm, args) -> None:
+    fm.rename(args.src, args.dst)
+    print(f"Renamed {args.src} to {args.dst}")
+
+
+def _handle_dig(fm, args) -> None:
+    try:
+        logging.getLogger().setLevel(logging.WARNING)
+        print(fm.dig(args.path))
+    except Exception as e:
+        sys.stderr.write(f"dig error: {e}\n")
+        raise SystemExit(1)
+
+
+def _handle_carrot(fm, args) -> None:
+    try:
+        logging.getLogger().setLevel(logging.WARNING)
+        print(fm.carrot(args.path))
+    except Exception as e:
+        sys.stderr.write(f"carrot error: {e}\n")
+        raise SystemExit(1)
+
+
+# Subcommand name -> handler, plus token sets used to classify argv.
+_HANDLERS = {
+    "spot": _handle_spot,
+    "hop": _handle_hop,
+    "peek": _handle_peek,
+    "copy": _handle_copy,
+    "move": _handle_move,
+    "bury": _handle_bury,
+    "rename": _handle_rename,
+    "dig": _handle_dig,
+    "carrot": _handle_carrot,
+}
+_SUBCOMMANDS = frozenset(_HANDLERS)
+_HELP_FLAGS = frozenset(("-h", "--help"))
+_VERBOSE_FLAGS = frozenset(("-V", "--verbose"))
+
+
+def _launch_burrow(verbose: bool) -> None:
+    """Enter the interactive burrow subshell (PowerShell on Windows, else bash).
+
+    The shell helpers ship as static package data (`burrow.ps1`, `burrow.sh`);
+    per-session values are passed through the environment.
     """
+    # Disallow nested subshells (prevents confusing double prompts/state).
+    if os.environ.get("FILEBUNNY_BURROW") == "1":
+        print("Already inside a filebunny burrow. Use 'leave' to exit.")
+        return
+    import platform
+    import subprocess
+    from importlib.resources import as_file, files
+    from filebunny.manager import FileManager
+
+    # Auto-enter burrow subshell immediately.
+    fm = FileManager(_get_storage())
+    try:
+        dest = fm.spot()
+        env = dict(os.environ, FILEBUNNY_ORIGIN=dest, FILEBUNNY_BURROW="1")
+        # Commands inside the burrow must follow the shell's own directory
+        env.pop("FILEBUNNY_CWD", None)
+        if verbose:
+            # Enable logging only for this subshell session
+            env["FILEBUNNY_LOG_LEVEL"] = "INFO"
+        if platform.system() == "Windows":
+            print(BANNER)
+            # Pass the helpers inline: -Command text runs in the global scope
+            # (as if typed at the prompt) and, unlike a script file, is not
+            # gated by the user's execution policy, so none is overridden.
+            script = files("filebunny").joinpath("burrow.ps1").read_text(encoding="utf-8")
+            subprocess.run(["powershell", "-NoExit", "-Command", script], env=env, check=True)
+        else:
+            shell = os.environ.get("SHELL") or "/bin/sh"
+            if shell.endswith("bash"):
+                import tempfile
+                # Burrow daemon for the bash helpers (see filebunny.daemon).
+                # Private (0700) directory so only this user can reach the socket.
+                sock_dir = tempfile.mkdtemp(prefix="filebunny-")
+                sock_path = os.path.join(sock_dir, "daemon.sock")
+                env["FILEBUNNY_SOCKET"] = sock_path
+                daemon = subprocess.Popen(
+                    [sys.executable, "-m", "filebunny.daemon", sock_path],
+                    env=env,
+                    stdin=subprocess.DEVNULL,
+                )
+                print(BANNER)
+                try:
+                    with as_file(files("filebunny") / "burrow.sh") as rc_path:
+                        subprocess.run([shell, "--rcfile", str(rc_path), "-i"], cwd=dest, env=env, check=True)
+                finally:
+                    daemon.terminate()
+                    try:
+                        daemon.wait(timeout=5)
+                    except subprocess.TimeoutExpired:
+                        daemon.kill()
+                        daemon.wait()
+                    try:
+                        os.unlink(sock_path)
+                    except OSError:
+                        pass
+                    try:
+                        os.rmdir(sock_dir)
+                    except OSError:
+                        pass
+            else:
+                subprocess.run([shell, "-i"], cwd=dest, check=True)
+    except Exception as e:
+        sys.stderr.write(f"burrow error: {e}\n")
+        raise SystemExit(1)
+
+
+@lru_cache(maxsize=1)
+def _get_parser():
+    """Build the full argparse tree once per process.
+
+    Only reached for commands `_dispatch_fast` cannot handle; reused across
+    in-process `main()` calls (tests, long-lived callers).
+    """
+    import argparse
+
     parser = argparse.ArgumentParser(prog="filebunny", description="Hop/Spot File Manager")
     sub = parser.add_subparsers(dest="cmd", required=False)
 
@@ -124,309 +363,84 @@ def main():
     p_carrot = sub.add_parser("carrot", help="Create a file (touch)")
     p_carrot.add_argument("path", help="File path to create")
 
-    # Compute version early and register -v/--version before building banners.
-    # Prefer runtime package __version__, fall back to installed metadata.
-    _ver = FB_VERSION if FB_VERSION else None
-    if not _ver:
-        try:
-            _ver = pkg_version("filebunny")
-        except Exception:
-            _ver = "unknown"
-    parser.add_argument("-v", "--version", action="version", version=f"filebunny {_ver}")
+    # Register -v/--version with the same version string the banner shows.
+    parser.add_argument("-v", "--version", action="version", version=f"filebunny {_get_version()}")
     # Verbose flag (-V/--verbose) enables INFO logs for this run/session
     parser.add_argument("-V", "--verbose", action="store_true", help="Enable verbose logging for this run/session")
+    return parser
+
+
+def _dispatch_fast(argv: list[str], cwd: str | None = None) -> bool:
+    """Handle trivial invocations without building the argparse tree.
+
+    Covers the bare burrow launch, `-v/--version`, `spot` and `hop [path]`,
+    which shell helpers call on nearly every prompt. Anything with extra
+    flags falls through to the full parser. Returns True when handled.
+    """
+    if not argv:
+        _apply_env_log_level()
+        _launch_burrow(verbose=False)
+        return True
+    head = argv[0]
+    if len(argv) == 1 and head in ("-v", "--version"):
+        print(f"filebunny {_get_version()}")
+        raise SystemExit(0)
+    if argv == ["spot"]:
+        _apply_env_log_level()
+        _handle_spot(_direct_manager(cwd), None)
+        return True
+    if head == "hop" and (len(argv) == 1 or (len(argv) == 2 and not argv[1].startswith("-"))):
+        _apply_env_log_level()
+        _handle_hop(_direct_manager(cwd), SimpleNamespace(path=argv[1] if len(argv) == 2 else None))
+        return True
+    return False
+
+
+def main(argv: list[str] | None = None, cwd: str | None = None):
+    """Main CLI entry point.
+
+    Responsibilities:
+    - Dispatch trivial invocations (`spot`, `hop [path]`, `-v`, bare burrow)
+      without building the parser; see `_dispatch_fast`.
+    - Build the argparse tree once (`_get_parser`) with global flags (e.g., `-v/--version`).
+    - Print the ASCII banner for top-level help without a subcommand.
+    - Launch an interactive subshell (PowerShell/bash) when no subcommand is
+      provided, with helpers bound for convenience.
+    - Disallow nested subshells via `FILEBUNNY_BURROW`.
+    - For direct subcommands, operate relative to the caller's current working
+      directory (CWD), not the persisted spot; `cwd` overrides it for
+      in-process callers such as the burrow daemon.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    if _dispatch_fast(argv, cwd):
+        return
 
     # If user requested top-level help (-h/--help) without a subcommand,
-    # print the banner and exit immediately.
-
-    argv = sys.argv[1:]
-    top_level_help = any(flag in argv for flag in ("-h", "--help"))
-    verbose_requested = any(flag in argv for flag in ("-V", "--verbose"))
-    subcommands = {"spot","hop","peek","copy","move","bury","rename","dig","carrot"}
-    mentions_sub = any(token in subcommands for token in argv)
-    # Prepare banner with version injected above 'Core Commands'.
-    banner = HEADER_BUNNY
-    try:
-        banner = HEADER_BUNNY.replace("Core Commands", f"filebunny {_ver}\n\nCore Commands")
-    except Exception:
-        pass
+    # print the banner and exit immediately (before building the parser).
+    # One pass over argv classifies every token.
+    top_level_help = verbose_requested = mentions_sub = False
+    for token in argv:
+        if token in _HELP_FLAGS:
+            top_level_help = True
+        elif token in _VERBOSE_FLAGS:
+            verbose_requested = True
+        elif token in _SUBCOMMANDS:
+            mentions_sub = True
     if top_level_help and not mentions_sub:
-        print(banner)
+        print(BANNER)
         return
 
-    args = parser.parse_args()
+    parser = _get_parser()
+    args = parser.parse_args(argv)
     verbose = bool(getattr(args, "verbose", False) or verbose_requested)
-    # Honor FILEBUNNY_LOG_LEVEL for this process (helps tests and direct runs)
-    _lvl = os.environ.get("FILEBUNNY_LOG_LEVEL")
-    if _lvl:
-        try:
-            logging.getLogger().setLevel(getattr(logging, _lvl.upper(), logging.INFO))
-        except Exception:
-            logging.getLogger().setLevel(logging.INFO)
+    _apply_env_log_level()
     if getattr(args, "cmd", None) is None:
-        # Disallow nested subshells (prevents confusing double prompts/state).
-        if os.environ.get("FILEBUNNY_BURROW") == "1":
-            print("Already inside a filebunny burrow. Use 'leave' to exit.")
-            return
-        # Auto-enter burrow subshell immediately.
-        fm = FileManager(Storage())
-        try:
-            dest = fm.spot()
-            if platform.system() == "Windows":
-                # PowerShell helpers: forward all remaining arguments to the
-                # real `filebunny` subcommands so argparse `-h/--help` works.
-                # `hop` only changes directory when a valid path is returned.
-                ps_function = textwrap.dedent(
-                    """
-                    function global:spot {
-                        param([Parameter(ValueFromRemainingArguments=$true)][string[]]$Args)
-                        if ($Args -and $Args.Count -gt 0) {
-                            filebunny spot @Args
-                            return
-                        }
-                        $dest = (filebunny spot)
-                        if ($LASTEXITCODE -eq 0 -and $dest) { Write-Output $dest }
-                    }
-                    function global:hop {
-                        param([Parameter(ValueFromRemainingArguments=$true)][string[]]$Args)
-                        # If asking for help, just forward and return (avoid Set-Location)
-                        if ($Args -and ($Args -contains '-h' -or $Args -contains '--help')) {
-                            filebunny hop @Args
-                            return
-                        }
-                        $dest = (filebunny hop @Args)
-                        if ($LASTEXITCODE -ne 0) { return }
-                        # Normalize and validate the returned path before attempting to cd
-                        if ($null -ne $dest) { $dest = $dest | Select-Object -First 1 }
-                        if ($dest) { $dest = $dest.Trim() }
-                        if ($dest -and (Test-Path -LiteralPath $dest)) { Set-Location -LiteralPath $dest }
-                    }
-                    function global:peek {
-                        param([Parameter(ValueFromRemainingArguments=$true)][string[]]$Args)
-                        filebunny peek @Args
-                    }
-                    function global:dig {
-                        param([Parameter(ValueFromRemainingArguments=$true)][string[]]$Args)
-                        filebunny dig @Args
-                    }
-                    function global:carrot {
-                        param([Parameter(ValueFromRemainingArguments=$true)][string[]]$Args)
-                        filebunny carrot @Args
-                    }
-                    function global:copy {
-                        param([Parameter(ValueFromRemainingArguments=$true)][string[]]$Args)
-                        filebunny copy @Args
-                    }
-                    function global:move {
-                        param([Parameter(ValueFromRemainingArguments=$true)][string[]]$Args)
-                        filebunny move @Args
-                    }
-                    function global:bury {
-                        param([Parameter(ValueFromRemainingArguments=$true)][string[]]$Args)
-                        filebunny bury @Args
-                    }
-                    function global:rename {
-                        param([Parameter(ValueFromRemainingArguments=$true)][string[]]$Args)
-                        filebunny rename @Args
-                    }
-                    # Simple white prompt for this burrow session
-                    function global:prompt {
-                        Write-Host "₍ᐢ. .ᐢ₎ $(Get-Location) > " -NoNewline
-                        return ' '
-                    }
-                    """
-                ).strip()
-                # Add a 'leave' helper. With -d, revert persisted spot to origin
-                # before exiting this subshell session.
-                ps_function = ps_function + textwrap.dedent(
-                    """
-                    function leave {
-                        param([switch]$d)
-                        if ($d) { $null = filebunny hop $env:FILEBUNNY_ORIGIN }
-                        exit
-                    }
-                    """
-                )
-                # Build optional verbose export for PowerShell outside of f-string expression
-                verbose_ps = "$env:FILEBUNNY_LOG_LEVEL='INFO'; " if verbose else ""
-                ps_command = (
-                    f"$env:FILEBUNNY_ORIGIN=\"{dest}\"; $env:FILEBUNNY_BURROW='1'; "
-                    f"{verbose_ps}"
-                    f"{ps_function}; "
-                    "Remove-Item alias:copy -ErrorAction SilentlyContinue; "
-                    "Remove-Item alias:move -ErrorAction SilentlyContinue; "
-                    "Remove-Item alias:rename -ErrorAction SilentlyContinue; "
-                    f"Write-Host @'\n{banner}\n'@; Set-Location -LiteralPath \"{dest}\""
-                )
-                subprocess.run(["powershell", "-NoExit", "-Command", ps_command], check=True)
-            else:
-                shell = os.environ.get("SHELL") or "/bin/sh"
-                if shell.endswith("bash"):
-                    # Bash helpers: similar forwarding behavior; `leave -d`
-                    # restores the origin spot prior to exiting.
-                    rc = textwrap.dedent(
-                        """
-                        # Remember the origin spot for this burrow session
-                        export FILEBUNNY_ORIGIN="${ORIGIN}"
-                        # Mark that we're inside a filebunny burrow to prevent nesting
-                        export FILEBUNNY_BURROW=1
-                        # If verbose requested, enable logging only for this subshell session
-                        ${VERBOSE_EXPORT}
-                        spot() {
-                          filebunny spot
-                        }
-                        hop() {
-                          local dest
-                          if [ $# -gt 0 ]; then
-                            dest="$(filebunny hop "$1")"
-                          else
-                            dest="$(filebunny hop)"
-                          fi
-                          if [ -n "$dest" ] && [ -d "$dest" ]; then
-                            cd "$dest"
-                          fi
-                        }
-                        peek() {
-                          filebunny peek "$@"
-                        }
-                        dig() {
-                          if [ $# -lt 1 ]; then echo "usage: dig DIR" >&2; return 1; fi
-                          filebunny dig "$1"
-                        }
-                        carrot() {
-                          if [ $# -lt 1 ]; then echo "usage: carrot FILE" >&2; return 1; fi
-                          filebunny carrot "$1"
-                        }
-                        copy() {
-                          if [ $# -lt 2 ]; then echo "usage: copy SRC DST" >&2; return 1; fi
-                          filebunny copy "$1" "$2"
-                        }
-                        move() {
-                          if [ $# -lt 2 ]; then echo "usage: move SRC DST" >&2; return 1; fi
-                          filebunny move "$1" "$2"
-                        }
-                        bury() {
-                          if [ $# -lt 1 ]; then echo "usage: bury PATH" >&2; return 1; fi
-                          filebunny bury "$1"
-                        }
-                        rename() {
-                          if [ $# -lt 2 ]; then echo "usage: rename SRC DST" >&2; return 1; fi
-                          filebunny rename "$1" "$2"
-                        }
-                        # leave [-d|--discard]: exit subshell; if discard is set, revert persisted spot to origin
-                        leave() {
-                          if [ "$1" = "-d" ]; then
-                            filebunny hop "$FILEBUNNY_ORIGIN" >/dev/null
-                          fi
-                          builtin exit
-                        }
-                        # Print shared header, then simple white prompt for this burrow session
-                        echo "${HEADER}"  # placeholder, replaced below by Python
-                        # Simple white prompt for this burrow session
-                        PS1='₍ᐢ. .ᐢ₎ \w > '
-                        """
-                    )
-                    rc = rc.replace("${HEADER}", banner)
-                    rc = rc.replace("${ORIGIN}", dest)
-                    rc = rc.replace("${VERBOSE_EXPORT}", ("export FILEBUNNY_LOG_LEVEL=INFO" if verbose else "# verbosity off"))
-                    with tempfile.NamedTemporaryFile("w", delete=False, suffix=".rc") as tf:
-                        tf.write(rc)
-                        rc_path = tf.name
-                    try:
-                        subprocess.run([shell, "--rcfile", rc_path, "-i"], cwd=dest, check=True)
-                    finally:
-                        try:
-                            os.unlink(rc_path)
-                        except OSError:
-                            pass
-                else:
-                    subprocess.run([shell, "-i"], cwd=dest, check=True)
-        except Exception as e:
-            sys.stderr.write(f"burrow error: {e}\n")
-            raise SystemExit(1)
+        _launch_burrow(verbose)
         return
-    fm = FileManager(Storage())
-    # For direct subcommands (not auto-burrow), operate relative to the caller's
-    # current working directory (CWD), not the persisted spot.
-    fm.cwd = Path.cwd()
+    fm = _direct_manager(cwd)
     # If -V was provided for a direct command, elevate to INFO for decorators
     if verbose:
         logging.getLogger().setLevel(logging.INFO)
 
-    match args.cmd:
-        case "spot": 
-            try:
-                print(fm.spot())
-            except Exception as e:
-                sys.stderr.write(f"spot error: {e}\n")
-                raise SystemExit(1)
-        case "hop": 
-            try:
-                print(fm.hop(args.path))
-            except Exception as e:
-                sys.stderr.write(f"hop error: {e}\n")
-                raise SystemExit(1)
-        case "peek": 
-            # Build a long listing from the current spot
-            root = Path(fm.spot())
-            paths = sorted(root.iterdir(), key=lambda p: (0 if p.is_dir() else 1, p.name.lower()))
-            if not getattr(args, "all", False):
-                paths = [p for p in paths if not p.name.startswith('.')]
-
-            # Header
-            print()
-            print()
-            print(f"Dig: {root}")
-            print()
-            print(f"{'Mode':<6}  {'LastWriteTime':<22}  {'Length':>10} {'Name'}")
-            print(f"{'-'*4:<6}  {'-'*13:<22}  {'-'*6:>10} {'-'*4}")
-
-            def fmt_time(ts: float) -> str:
-                dt = datetime.fromtimestamp(ts)
-                # Build like 9/28/2025  10:11 AM (no leading zeros in m/d, two spaces before time)
-                m = dt.month
-                d = dt.day
-                Y = dt.year
-                h = dt.hour % 12 or 12
-                minute = dt.minute
-                ampm = 'AM' if dt.hour < 12 else 'PM'
-                return f"{m}/{d}/{Y}  {h}:{minute:02d} {ampm}"
-
-            for p in paths:
-                try:
-                    st = p.stat()
-                    mode = 'd-----' if p.is_dir() else '-a----'
-                    when = fmt_time(st.st_mtime)
-                    length = '' if p.is_dir() else str(st.st_size)
-                    print(f"{mode:<6}  {when:<22}  {length:>10} {p.name}")
-                except OSError as e:
-                    # On error stat'ing an entry, show minimal info
-                    sys.stderr.write(f"peek error: {p.name}: {e}\n")
-            print()
-            print()
-        case "copy": 
-            fm.copy(args.src, args.dst)
-            print(f"Copied {args.src} to {args.dst}")
-        case "move": 
-            fm.move(args.src, args.dst)
-            print(f"Moved {args.src} to {args.dst}")
-        case "bury": 
-            fm.delete(args.path)
-            print(f"Buried {args.path}")
-        case "rename": 
-            fm.rename(args.src, args.dst)
-            print(f"Renamed {args.src} to {args.dst}")
-        case "dig":
-            try:
-                logging.getLogger().setLevel(logging.WARNING)
-                print(fm.dig(args.path))
-            except Exception as e:
-                sys.stderr.write(f"dig error: {e}\n")
-                raise SystemExit(1)
-        case "carrot":
-            try:
-                logging.getLogger().setLevel(logging.WARNING)
-                print(fm.carrot(args.path))
-            except Exception as e:
-                sys.stderr.write(f"carrot error: {e}\n")
-                raise SystemExit(1)
+    _HANDLERS[args.cmd](fm, args)
@@ -0,0 +1,132 @@
+"""
+Long-lived command server for the burrow subshell.
+
+The bash burrow starts `python -m filebunny.daemon SOCKET` and its helpers
+send each command over that Unix domain socket instead of spawning a fresh
+`filebunny` process (interpreter start-up + imports) per keystroke chain.
+
+Protocol (one request per connection):
+- Request: a single JSON line `{"argv": [...], "cwd": "..."}`. Raw control
+  characters and non-UTF-8 bytes inside strings are tolerated.
+- Response: line-framed text a shell can consume without a JSON parser:
+  `a` as soon as the request is accepted (before it runs), then `o <line>`
+  per stdout line, `e <line>` per stderr line, then `x <code>`. A client that
+  saw no `a` line knows the command never ran and may safely retry it some
+  other way; after `a` it must not.
+
+Requests are served one at a time; each runs `cli.main(argv, cwd)` against the
+caller's working directory with stdout/stderr captured. The daemon's own
+process CWD is never changed.
+"""
+
+from contextlib import redirect_stderr, redirect_stdout
+import io
+import json
+import logging
+import os
+import signal
+import socket
+import sys
+
+from filebunny import cli
+
+
+class _Terminated(BaseException):
+    """Raised by the SIGTERM handler.
+
+    Not a SystemExit/Exception subclass, so it passes through run()'s
+    handlers (which absorb a command's own exits/errors) and stops the daemon
+    even when the signal lands mid-request.
+    """
+
+
+def _on_sigterm(signum, frame):
+    raise _Terminated
+
+
+def run(argv: list[str], cwd: str | None = None) -> tuple[int, str, str]:
+    """Run one CLI invocation in-process; return (exit code, stdout, stderr)"""
+    out, err = io.StringIO(), io.StringIO()
+    code = 0
+    # Commands adjust the root level (-V, dig/carrot); don't leak it into the next one
+    prev_level = logging.getLogger().level
+    try:
+        with redirect_stdout(out), redirect_stderr(err):
+            try:
+                cli.main(argv, cwd)
+            except SystemExit as e:
+                if e.code is None:
+                    code = 0
+                elif isinstance(e.code, int):
+                    code = e.code
+                else:
+                    err.write(f"{e.code}\n")
+                    code = 1
+            except Exception as e:
+                err.write(f"filebunny: {e}\n")
+                code = 1
+    finally:
+        logging.getLogger().setLevel(prev_level)
+    return code, out.getvalue(), err.getvalue()
+
+
+def _frame(code: int, out: str, err: str) -> bytes:
+    """Encode a response in the line-framed wire format"""
+    lines = [f"o {line}" for line in out.splitlines()]
+    lines += [f"e {line}" for line in err.splitlines()]
+    lines.append(f"x {code}")
+    # Undecodable filenames reach us as lone surrogates (os.fsdecode); give the
+    # shell back the original bytes instead of failing to encode them
+    return ("\n".join(lines) + "\n").encode("utf-8", "surrogateescape")
+
+
+def _handle(conn: socket.socket) -> None:
+    with conn.makefile("rb") as rf:
+        line = rf.readline()
+    try:
+        # The bash client only escapes quotes, backslashes, tabs and newlines
+        # and passes argument/PWD bytes through as-is: accept raw control
+        # characters and keep undecodable bytes as surrogates, like os.fsdecode
+        req = json.loads(line.decode("utf-8", "surrogateescape"), strict=False)
+        argv = [str(a) for a in req["argv"]]
+        cwd = req.get("cwd")
+    except (ValueError, KeyError, TypeError) as e:
+        conn.sendall(_frame(2, "", f"filebunny daemon: bad request: {e}"))
+        return
+    # Acknowledge before running: from here on the client must not retry
+    conn.sendall(b"a\n")
+    conn.sendall(_frame(*run(argv, cwd)))
+
+
+def serve(path: str) -> None:
+    """Serve requests on the Unix socket at `path` until terminated"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as srv:
+        srv.bind(path)
+        try:
+            srv.listen()
+            while True:
+                conn, _ = srv.accept()
+                with conn:
+                    try:
+                        _handle(conn)
+                    except Exception as e:
+                        # One bad request (or a client that went away) must not
+                        # take down the daemon for the rest of the burrow
+                        logging.warning("daemon request failed: %s", e)
+        finally:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        sys.stderr.write("usage: python -m filebunny.daemon SOCKET\n")
+        raise SystemExit(2)
+    # Unwind through serve()'s finally on SIGTERM so the socket file is cleaned up
+    signal.signal(signal.SIGTERM, _on_sigterm)
+    try:
+        serve(sys.argv[1])
+    except _Terminated:
+        pass
@@ -2,10 +2,16 @@
 FileManager class with operations
 """
 
+from functools import cache
+import os
 from pathlib import Path
-import shutil
 from .storage import Storage, State
-from .utils import log_call, log_timing, log_errors
+from .utils import log_op
+
+@cache
+def _home() -> Path:
+    """Home directory, resolved once per process"""
+    return Path.home()
 
 class FileManager:
     """Core file manager with hop/spot operations"""
@@ -19,12 +25,10 @@ class FileManager:
         """Save current state to disk"""
         self.storage.write(State(last_spot=str(self.cwd)))
 
-    @log_errors
-    @log_call
-    @log_timing
+    @log_op
     def hop(self, path: str | None = None) -> str:
         """Change directory (hop to a new spot)"""
-        new = Path(path) if path else Path.home()
+        new = Path(path) if path else _home()
         target = (self.cwd / new).resolve() if not new.is_absolute() else new.resolve()
         if not target.exists():
             raise FileNotFoundError(f"path does not exist: {target}")
@@ -34,71 +38,60 @@ class FileManager:
         self._persist()
         return str(self.cwd)
 
-    @log_errors
-    @log_call
-    @log_timing
+    @log_op
     def spot(self) -> str:
         """Show current directory (current spot)"""
         return str(self.cwd)
 
-    @log_errors
-    @log_call
-    @log_timing
+    @log_op
     def list(self) -> list[str]:
         """List contents of current directory"""
         return [p.name for p in self.cwd.iterdir()]
 
-    @log_errors
-    @log_call
-    @log_timing
+    @log_op
     def copy(self, src: str, dst: str):
         """Copy file or directory"""
+        import shutil
         s, d = self.cwd / src, self.cwd / dst
         if s.is_dir():
             shutil.copytree(s, d)
         else:
             shutil.copy2(s, d)
 
-    @log_errors
-    @log_call
-    @log_timing
+    @log_op
     def move(self, src: str, dst: str):
         """Move file or directory"""
+        import shutil
         shutil.move(str(self.cwd / src), str(self.cwd / dst))
 
-    @log_errors
-    @log_call
-    @log_timing
+    @log_op
     def delete(self, path: str):
         """Delete file or directory"""
-        target = (self.cwd / path).resolve()
-        if target.is_dir():
+        target = self.cwd / path
+        # A symlink to a directory is removed as a link, not recursed into
+        if target.is_dir() and not target.is_symlink():
+            import shutil
             shutil.rmtree(target)
         else:
             target.unlink(missing_ok=False)
 
-    @log_errors
-    @log_call
-    @log_timing
+    @log_op
     def rename(self, src: str, dst: str):
         """Rename file or directory"""
         (self.cwd / src).rename(self.cwd / dst)
 
-    @log_errors
-    @log_call
-    @log_timing
+    @log_op
     def dig(self, path: str) -> str:
         """Create a directory (mkdir -p behavior) and return its absolute path"""
-        target = (self.cwd / path).resolve()
+        # abspath normalizes lexically; no per-component stat like resolve()
+        target = Path(os.path.abspath(self.cwd / path))
         target.mkdir(parents=True, exist_ok=True)
         return str(target)
 
-    @log_errors
-    @log_call
-    @log_timing
+    @log_op
     def carrot(self, path: str) -> str:
         """Create a file (touch behavior) and return its absolute path"""
-        target = (self.cwd / path).resolve()
+        target = Path(os.path.abspath(self.cwd / path))
         # Ensure parent exists; mimic touch by creating parents if needed
         target.parent.mkdir(parents=True, exist_ok=True)
         target.touch(exist_ok=True)
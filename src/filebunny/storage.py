@@ -4,8 +4,22 @@ State persistence for filebunny using platformdirs
 
 from dataclasses import dataclass, asdict
 from pathlib import Path
-import json
-from platformdirs import user_config_dir
+import atexit
+import logging
+import os
+import queue
+import re
+import threading
+
+# spot.json has a fixed one-field schema. Paths without quotes, backslashes,
+# control characters or lone surrogates (undecodable bytes from os.fsdecode,
+# which UTF-8 cannot encode) round-trip without escaping, so the common case
+# skips the json module entirely; anything else falls back to it (imported
+# lazily).
+_SPOT_RE = re.compile(r'\{\s*"last_spot"\s*:\s*"([^"\\\x00-\x1f]*)"\s*\}\s*')
+_NEEDS_ESCAPE = re.compile(r'["\\\x00-\x1f\ud800-\udfff]')
+# Keep Windows from translating newlines on raw file descriptors
+_O_BINARY = getattr(os, "O_BINARY", 0)
 
 @dataclass
 class State:
@@ -13,25 +27,99 @@ class State:
     last_spot: str
 
 class Storage:
-    """Handles reading and writing application state"""
-    
+    """Handles reading and writing application state
+
+    Writes are handed to a background thread so `hop` returns without waiting
+    on disk I/O. Only the newest pending state matters, so the queue holds a
+    single entry and older states are dropped. Pending writes are flushed
+    before reads and at interpreter exit.
+    """
+
     def __init__(self):
+        # Deferred: platformdirs is only needed once a command touches state
+        from platformdirs import user_config_dir
         config_dir = Path(user_config_dir("filebunny"))
         config_dir.mkdir(parents=True, exist_ok=True)
         self.path = config_dir / "spot.json"
+        # Plain strings for the os-level calls in read()/_write_now()
+        self._path_str = str(self.path)
+        self._tmp_str = self._path_str + ".tmp"
+        self._queue: queue.Queue[State] = queue.Queue(maxsize=1)
+        self._writer: threading.Thread | None = None
 
     def read(self) -> State:
         """Read state from disk, return default if not found"""
-        if not self.path.exists():
+        self._flush()
+        try:
+            fd = os.open(self._path_str, os.O_RDONLY | _O_BINARY)
+        except FileNotFoundError:
             return State(last_spot=str(Path.cwd()))
         try:
-            data = json.loads(self.path.read_text(encoding="utf-8"))
+            chunks = []
+            while chunk := os.read(fd, 65536):
+                chunks.append(chunk)
+        finally:
+            os.close(fd)
+        text = b"".join(chunks).decode("utf-8")
+        m = _SPOT_RE.fullmatch(text)
+        if m:
+            return State(last_spot=m.group(1))
+        import json
+        try:
+            data = json.loads(text)
             return State(**data)
         except json.JSONDecodeError:
             return State(last_spot=str(Path.cwd()))
 
     def write(self, state: State) -> None:
+        """Queue state for the background writer (newest state wins)"""
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._drain, name="filebunny-storage", daemon=True)
+            self._writer.start()
+            atexit.register(self._flush)
+        while True:
+            try:
+                self._queue.put_nowait(state)
+                return
+            except queue.Full:
+                # Drop the stale pending state; the writer may race us to it
+                try:
+                    self._queue.get_nowait()
+                    self._queue.task_done()
+                except queue.Empty:
+                    pass
+
+    def _flush(self) -> None:
+        """Block until every queued state has been written"""
+        self._queue.join()
+
+    def _drain(self) -> None:
+        """Background writer loop"""
+        while True:
+            state = self._queue.get()
+            try:
+                self._write_now(state)
+            except Exception as e:
+                # Keep the writer alive: a dead thread would leave queued
+                # states unfinished and hang every later read()/_flush()
+                logging.error("ERROR writing %s: %s", self.path, e)
+                try:
+                    os.unlink(self._tmp_str)
+                except OSError:
+                    pass
+            finally:
+                self._queue.task_done()
+
+    def _write_now(self, state: State) -> None:
         """Write state to disk atomically"""
-        tmp = self.path.with_suffix(".tmp")
-        tmp.write_text(json.dumps(asdict(state), indent=2), encoding="utf-8")
-        tmp.replace(self.path)
\ No newline at end of file
+        if _NEEDS_ESCAPE.search(state.last_spot):
+            import json
+            payload = json.dumps(asdict(state)) + "\n"
+        else:
+            payload = f'{{"last_spot": "{state.last_spot}"}}\n'
+        fd = os.open(self._tmp_str, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY, 0o600)
+        try:
+            os.write(fd, payload.encode("utf-8"))
+        finally:
+            os.close(fd)
+        os.replace(self._tmp_str, self._path_str)
@@ -1,5 +1,5 @@
 """
-Logging decorators for filebunny operations.
+Logging decorator for filebunny operations.
 
 Verbosity can be controlled via environment variables:
 - `FILEBUNNY_LOG_LEVEL` (preferred): DEBUG, INFO, WARNING, ERROR, CRITICAL
@@ -7,8 +7,7 @@ Verbosity can be controlled via environment variables:
 """
 
 import logging
-import time
-from functools import wraps
+from time import perf_counter
 import sys
 import os
 
@@ -25,33 +24,25 @@ logging.basicConfig(
     stream=sys.stderr,
 )
 
-def log_call(fn):
-    """Log function calls with arguments"""
-    @wraps(fn)
-    def wrapper(*args, **kwargs):
-        logging.info("CALL %s args=%s kwargs=%s", fn.__name__, args[1:], kwargs)
-        return fn(*args, **kwargs)
-    return wrapper
-
-def log_timing(fn):
-    """Log function execution time"""
-    @wraps(fn)
-    def wrapper(*args, **kwargs):
-        start = time.perf_counter()
-        try:
-            return fn(*args, **kwargs)
-        finally:
-            elapsed = (time.perf_counter() - start) * 1000
-            logging.info("TIME %s: %.2f ms", fn.__name__, elapsed)
-    return wrapper
+# The level is checked on every call rather than at decoration time, because
+# the CLI raises it (-V, FILEBUNNY_LOG_LEVEL) after these modules are imported.
+# When INFO is disabled, the wrapper skips timing and formatting.
+# It skips functools.wraps (nothing introspects it) and captures the
+# wrapped function's name once at decoration time for log messages.
+_root = logging.getLogger()
 
-def log_errors(fn):
-    """Log function errors"""
-    @wraps(fn)
+def log_op(fn):
+    """Log call, timing and errors in a single wrapper (one frame per call)"""
+    name = fn.__name__
     def wrapper(*args, **kwargs):
+        start = perf_counter() if _root.isEnabledFor(logging.INFO) else None
         try:
-            return fn(*args, **kwargs)
+            result = fn(*args, **kwargs)
         except Exception as e:
-            logging.error("ERROR in %s: %s", fn.__name__, e)
+            logging.error("ERROR in %s: %s", name, e)
             raise
-    return wrapper
+        if start is not None:
+            elapsed = (perf_counter() - start) * 1000
+            logging.info("CALL %s args=%s kwargs=%s: %.2f ms", name, args[1:], kwargs, elapsed)
+        return result
+    return wrapper
\ No newline at end of file
@@ -0,0 +1,143 @@
+"""
+Shared fixtures for filebunny tests
+"""
+
+import copy
+import os
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+
+from filebunny.manager import FileManager
+from filebunny.storage import Storage, State
+
+
+def _path_eq(a, b) -> bool:
+    """Compare two already-absolute paths as strings (no stat, unlike samefile).
+
+    Fixture paths from tmp_path/tmp_path_factory are resolved, so no realpath
+    is needed to line them up with what filebunny prints.
+    """
+    return os.path.normcase(os.path.normpath(str(a))) == os.path.normcase(os.path.normpath(str(b)))
+
+
+def _make_file(p, data: bytes) -> None:
+    """Create (or truncate) `p` holding `data` via raw fd calls, no text layer"""
+    fd = os.open(str(p), os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+@pytest.fixture(scope="session")
+def path_eq():
+    """The path comparison helper, as a fixture so any --import-mode works"""
+    return _path_eq
+
+
+@pytest.fixture(scope="session")
+def make_file():
+    """The raw-fd file creation helper, as a fixture so any --import-mode works"""
+    return _make_file
+
+
+class MockStorage(Storage):
+    """Mock storage for testing"""
+    def __init__(self, initial_spot: str = None):
+        self.state = State(last_spot=initial_spot or str(Path.cwd()))
+
+    def read(self) -> State:
+        return self.state
+
+    def write(self, state: State) -> None:
+        self.state = state
+
+
+@pytest.fixture(scope="session", autouse=True)
+def quiet_warnings():
+    """Quiet warnings once for the whole session"""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("PYTHONWARNINGS", "ignore")
+        yield
+
+
+@pytest.fixture(autouse=True)
+def isolate_env(monkeypatch):
+    """Run every test in normal shell mode, free of the caller's FILEBUNNY_* vars"""
+    for key in [k for k in os.environ if k.startswith("FILEBUNNY_")]:
+        monkeypatch.delenv(key)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_cli():
+    """Pay the CLI's one-time costs before the first test runs.
+
+    Resolves the cached version via the `--version` fast path and builds the
+    lru_cached argparse tree, so per-test timings reflect only the command.
+    """
+    import filebunny.cli
+    try:
+        filebunny.cli.main(["--version"])
+    except SystemExit:
+        pass
+    filebunny.cli._get_parser()
+
+
+@pytest.fixture(scope="session")
+def payload() -> bytes:
+    """Content for files whose bytes a test checks after copy/move/rename"""
+    return b"x"
+
+
+@pytest.fixture
+def run_cli():
+    """Run `filebunny <argv...>` in-process; returns what main() returns"""
+    import filebunny.cli
+
+    def _run(*argv: str):
+        return filebunny.cli.main(list(argv))
+    return _run
+
+
+@pytest.fixture(scope="session")
+def session_tmp(tmp_path_factory) -> Path:
+    """One temp root shared by the whole session"""
+    return tmp_path_factory.mktemp("fb")
+
+
+@pytest.fixture
+def subdir(session_tmp: Path) -> Path:
+    """Fresh, empty directory for a single test under the session root"""
+    path = session_tmp / f"t{uuid4().hex}"
+    path.mkdir()
+    return path
+
+
+@pytest.fixture(scope="session")
+def _mock_storage_template() -> MockStorage:
+    """One MockStorage built per session; managers get shallow copies of it.
+
+    Building a throwaway FileManager on it here also pays FileManager's
+    one-time class/import setup before the first test.
+    """
+    template = MockStorage("/")
+    FileManager(template)
+    return template
+
+
+@pytest.fixture
+def fm_factory(_mock_storage_template: MockStorage):
+    """Build a FileManager whose spot is `spot`, on a copy of the storage template"""
+    def _make(spot) -> FileManager:
+        s = copy.copy(_mock_storage_template)
+        s.state = State(last_spot=str(spot))
+        return FileManager(s)
+    return _make
+
+
+@pytest.fixture
+def fm(fm_factory, subdir: Path) -> FileManager:
+    """FileManager whose spot is the test's own directory"""
+    return fm_factory(subdir)
@@ -0,0 +1,76 @@
+import json
+import os
+import socket
+from pathlib import Path
+
+import pytest
+
+from filebunny import daemon
+
+
+def test_run_captures_output_and_exit_code(tmp_path: Path):
+    """run() executes a CLI command in the given cwd and captures its streams."""
+    (tmp_path / "file.txt").touch()
+    code, out, err = daemon.run(["peek"], str(tmp_path))
+    assert code == 0
+    assert "file.txt" in out
+    assert err == ""
+
+    code, out, err = daemon.run(["hop", "no_such_dir"], str(tmp_path))
+    assert code == 1
+    assert "hop error:" in err
+
+
+def test_handle_speaks_line_framed_protocol(tmp_path: Path):
+    """A JSON request line yields o/e lines followed by the x exit-code line."""
+    client, server = socket.socketpair()
+    with client, server:
+        request = json.dumps({"argv": ["spot"], "cwd": str(tmp_path)}) + "\n"
+        client.sendall(request.encode("utf-8"))
+        daemon._handle(server)
+        server.close()
+        reply = client.makefile("r", encoding="utf-8").read().splitlines()
+    assert reply[0] == "a"
+    assert reply[1] == f"o {tmp_path}"
+    assert reply[-1] == "x 0"
+
+
+def test_frame_passes_undecodable_bytes_through():
+    """Surrogate-escaped output is sent back as the original bytes."""
+    name = os.fsdecode(b"f\xff")
+    assert daemon._frame(0, f"{name}\n", "") == b"o f\xff\nx 0\n"
+
+
+def test_handle_accepts_raw_control_chars_and_undecodable_bytes(tmp_path: Path):
+    """The bash client sends control characters and non-UTF-8 bytes unescaped."""
+    cwd = os.path.join(os.fsencode(tmp_path), b"d\xff")
+    os.mkdir(cwd)
+    client, server = socket.socketpair()
+    with client, server:
+        client.sendall(b'{"cwd": "' + cwd + b'", "argv": ["carrot", "a\rb"]}\n')
+        daemon._handle(server)
+        server.close()
+        reply = client.makefile("rb").read().splitlines()
+    assert reply[-1] == b"x 0"
+    assert os.path.isfile(os.path.join(cwd, b"a\rb"))
+
+
+def test_run_leaves_process_cwd_alone(tmp_path: Path):
+    """Commands resolve against the request cwd; burying it still replies cleanly."""
+    before = os.getcwd()
+    doomed = tmp_path / "doomed"
+    doomed.mkdir()
+    code, out, err = daemon.run(["bury", str(doomed)], str(doomed))
+    assert (code, err) == (0, "")
+    assert "Buried" in out
+    assert not doomed.exists()
+    assert os.getcwd() == before
+
+
+def test_run_does_not_swallow_termination(monkeypatch):
+    """SIGTERM mid-request must stop the daemon, unlike a command's SystemExit."""
+    def main(argv, cwd=None):
+        daemon._on_sigterm(None, None)
+    monkeypatch.setattr(daemon.cli, "main", main)
+    with pytest.raises(daemon._Terminated):
+        daemon.run(["copy", "big", "elsewhere"])
@@ -3,134 +3,110 @@ Basic tests for FileManager
 """
 
 import pytest
-import tempfile
-import os
 from pathlib import Path
-from filebunny.manager import FileManager
-from filebunny.storage import Storage, State
-
-class MockStorage(Storage):
-    """Mock storage for testing"""
-    def __init__(self, initial_spot: str = None):
-        self.state = State(last_spot=initial_spot or str(Path.cwd()))
-    
-    def read(self) -> State:
-        return self.state
-    
-    def write(self, state: State) -> None:
-        self.state = state
-
-def test_spot():
+
+
+def test_spot(fm, subdir, path_eq):
     """Test spot command shows current directory"""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        storage = MockStorage(tmpdir)
-        fm = FileManager(storage)
-        assert os.path.samefile(fm.spot(), tmpdir)
+    assert path_eq(fm.spot(), subdir)
 
-def test_hop():
+def test_hop(fm, subdir, path_eq):
     """Test hop command changes directory"""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        storage = MockStorage(tmpdir)
-        fm = FileManager(storage)
-        
-        # Create a subdirectory
-        subdir = Path(tmpdir) / "subdir"
-        subdir.mkdir()
-        
-        # Hop to subdirectory
-        result = fm.hop("subdir")
-        assert os.path.samefile(result, subdir)
-        assert os.path.samefile(fm.spot(), subdir)
-
-def test_list():
+    # Create a subdirectory
+    target = subdir / "subdir"
+    target.mkdir()
+
+    # Hop to subdirectory
+    result = fm.hop("subdir")
+    assert path_eq(result, target)
+    assert path_eq(fm.spot(), target)
+
+def test_list(fm, subdir):
     """Test list command shows directory contents"""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        storage = MockStorage(tmpdir)
-        fm = FileManager(storage)
-        
-        # Create some files
-        (Path(tmpdir) / "file1.txt").touch()
-        (Path(tmpdir) / "file2.txt").touch()
-        
-        contents = fm.list()
-        assert "file1.txt" in contents
-        assert "file2.txt" in contents
-        assert len(contents) == 2
-
-def test_copy():
-    """Test copy command"""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        storage = MockStorage(tmpdir)
-        fm = FileManager(storage)
-        
-        # Create source file
-        src_file = Path(tmpdir) / "source.txt"
-        src_file.write_text("test content")
-        
-        # Copy file
-        fm.copy("source.txt", "copy.txt")
-        
-        # Verify copy exists
-        copy_file = Path(tmpdir) / "copy.txt"
-        assert copy_file.exists()
-        assert copy_file.read_text() == "test content"
-
-def test_move_and_rename_and_delete():
-    """Test move, rename, and delete operations"""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        storage = MockStorage(tmpdir)
-        fm = FileManager(storage)
+    f1, f2 = subdir / "file1.txt", subdir / "file2.txt"
 
-        # Create a file
-        a = Path(tmpdir) / "a.txt"
-        a.write_text("A")
+    # Create some files
+    f1.touch()
+    f2.touch()
 
-        # Move file
-        fm.move("a.txt", "b.txt")
-        b = Path(tmpdir) / "b.txt"
-        assert b.exists() and not a.exists()
+    contents = fm.list()
+    assert "file1.txt" in contents
+    assert "file2.txt" in contents
+    assert len(contents) == 2
 
-        # Rename file
-        fm.rename("b.txt", "c.txt")
-        c = Path(tmpdir) / "c.txt"
-        assert c.exists() and not b.exists()
+def test_copy(fm, subdir):
+    """Test copy command"""
+    # Create source file
+    src_file = subdir / "source.txt"
+    src_file.write_text("test content")
+
+    # Copy file
+    fm.copy("source.txt", "copy.txt")
 
-        # Delete file
-        fm.delete("c.txt")
-        assert not c.exists()
+    # Verify copy exists
+    copy_file = subdir / "copy.txt"
+    assert copy_file.exists()
+    assert copy_file.read_text() == "test content"
 
-def test_dig_and_carrot():
+def test_move_and_rename_and_delete(fm, subdir):
+    """Test move, rename, and delete operations"""
+    a, b, c = subdir / "a.txt", subdir / "b.txt", subdir / "c.txt"
+
+    # Create a file
+    a.touch()
+
+    # Move file
+    fm.move("a.txt", "b.txt")
+    assert b.exists() and not a.exists()
+
+    # Rename file
+    fm.rename("b.txt", "c.txt")
+    assert c.exists() and not b.exists()
+
+    # Delete file
+    fm.delete("c.txt")
+    assert not c.exists()
+
+def test_delete_symlink_keeps_target(fm, subdir):
+    """bury on a symlink to a directory removes the link, not the target"""
+    target, link = subdir / "real", subdir / "link"
+    target.mkdir()
+    (target / "keep.txt").touch()
+    try:
+        link.symlink_to(target, target_is_directory=True)
+    except OSError:
+        pytest.skip("symlinks not supported here")
+
+    fm.delete("link")
+    assert not link.is_symlink() and not link.exists()
+    assert (target / "keep.txt").is_file()
+
+def test_dig_and_carrot(fm, subdir, path_eq):
     """Test dig (mkdir -p) and carrot (touch)"""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        storage = MockStorage(tmpdir)
-        fm = FileManager(storage)
-
-        # dig creates nested directory
-        out_dir = fm.dig("burrow/nest")
-        assert Path(out_dir).exists() and Path(out_dir).is_dir()
-        assert os.path.samefile(out_dir, Path(tmpdir) / "burrow" / "nest")
-
-        # carrot creates file (and parents if needed)
-        out_file = fm.carrot("burrow/nest/carrot.txt")
-        p = Path(out_file)
-        assert p.exists() and p.is_file()
-        assert p.read_text() == ""  # created empty if not exists
-
-def test_hop_errors():
+    nest = subdir / "burrow" / "nest"
+
+    # dig creates nested directory
+    out_dir = Path(fm.dig("burrow/nest"))
+    assert out_dir.is_dir()
+    assert path_eq(out_dir, nest)
+
+    # carrot creates file (and parents if needed)
+    p = Path(fm.carrot("burrow/nest/carrot.txt"))
+    assert p.is_file()
+    assert path_eq(p, nest / "carrot.txt")
+    assert p.read_text() == ""  # created empty if not exists
+
+def test_hop_errors(fm, subdir):
     """Test hop raises on non-existent or non-directory targets"""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        storage = MockStorage(tmpdir)
-        fm = FileManager(storage)
-
-        # Non-existent path
-        with pytest.raises(FileNotFoundError):
-            fm.hop("no_such_dir")
-
-        # Create a file and try to hop into it
-        f = Path(tmpdir) / "file.txt"
-        f.write_text("x")
-        with pytest.raises(NotADirectoryError):
-            fm.hop("file.txt")
+    # Non-existent path
+    with pytest.raises(FileNotFoundError):
+        fm.hop("no_such_dir")
+
+    # Create a file and try to hop into it
+    f = subdir / "file.txt"
+    f.touch()
+    with pytest.raises(NotADirectoryError):
+        fm.hop("file.txt")
 
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,83 @@
+import atexit
+import json
+import os
+import threading
+from pathlib import Path
+
+import pytest
+
+from filebunny.storage import Storage, State
+
+
+@pytest.fixture
+def storage(tmp_path: Path, monkeypatch):
+    """Storage whose config dir is the test's tmp_path"""
+    monkeypatch.setattr("platformdirs.user_config_dir", lambda *a, **k: str(tmp_path))
+    s = Storage()
+    yield s
+    # The exit-time flush is for real CLI runs; don't let a broken writer
+    # from one test block interpreter shutdown
+    atexit.unregister(s._flush)
+
+
+def test_plain_path_round_trips(storage: Storage):
+    """A path with nothing to escape takes the format-string/regex fast path."""
+    storage.write(State(last_spot="/home/bunny/burrow"))
+    assert storage.read() == State(last_spot="/home/bunny/burrow")
+    assert json.loads(storage.path.read_text()) == {"last_spot": "/home/bunny/burrow"}
+
+
+@pytest.mark.parametrize(
+    "spot",
+    ['/a "quoted" dir', "C:\\Users\\bunny", os.fsdecode(b"/x/d\xff")],
+    ids=["quote", "backslash", "surrogate"],
+)
+def test_escaped_path_round_trips(storage: Storage, spot: str):
+    """Paths needing escapes go through json and come back unchanged."""
+    storage.write(State(last_spot=spot))
+    assert storage.read() == State(last_spot=spot)
+
+
+def test_legacy_indented_file_parses(storage: Storage):
+    """spot.json written by older versions (json.dumps indent=2) still loads."""
+    storage.path.write_text(json.dumps({"last_spot": "/old/spot"}, indent=2))
+    assert storage.read() == State(last_spot="/old/spot")
+
+
+def test_missing_file_defaults_to_cwd(storage: Storage):
+    assert not storage.path.exists()
+    assert storage.read() == State(last_spot=str(Path.cwd()))
+
+
+def test_writes_coalesce_and_read_sees_newest(storage: Storage):
+    """Queued writes collapse to the newest state, which read() waits for."""
+    for i in range(50):
+        storage.write(State(last_spot=f"/spot/{i}"))
+    assert storage.read() == State(last_spot="/spot/49")
+    assert json.loads(storage.path.read_text()) == {"last_spot": "/spot/49"}
+    assert not os.path.exists(storage._tmp_str)
+
+
+def test_writer_survives_unexpected_error(storage: Storage, monkeypatch):
+    """A non-OSError from one write must not kill the writer and hang read()."""
+    real_write_now = storage._write_now
+    failed = threading.Event()
+
+    def flaky(state):
+        if not failed.is_set():
+            failed.set()
+            raise ValueError("boom")
+        real_write_now(state)
+    monkeypatch.setattr(storage, "_write_now", flaky)
+
+    storage.write(State(last_spot="/lost"))
+    assert failed.wait(timeout=5)
+    storage.write(State(last_spot="/newest"))
+    # A dead writer would block read() forever in queue.join(); fail instead
+    result = []
+    reader = threading.Thread(target=lambda: result.append(storage.read()), daemon=True)
+    reader.start()
+    reader.join(timeout=5)
+    assert not reader.is_alive(), "read() hung: storage writer thread died"
+    assert result == [State(last_spot="/newest")]
+    assert not os.path.exists(storage._tmp_str)